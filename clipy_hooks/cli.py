@@ -6,12 +6,18 @@ import subprocess as sp
 import sys
 from argparse import ArgumentParser
 from pathlib import Path
-from typing import List
+from typing import ClassVar, Dict, List, Tuple
+
+# After version like `8.0.0` is expected to be '\n' or ' '
+VERSION_REGEX = re.compile(r"((?:\d+\.)+[\d+_\+\-a-z]+)")
 
 
 class Command:
     """Super class that all commands inherit."""
 
+    # Detected tool versions keyed by (command, install_path).
+    _version_cache: ClassVar[Dict[Tuple[str, Path], str]] = {}
+
     def __init__(self, command: str, args: List[str], help_url: str = ""):
         """Construct the cli command class.
 
@@ -99,13 +105,26 @@ class Command:
         raise SystemExit(self.return_code)
 
     def get_version_str(self) -> str:
-        """Get the semantic version string for a given command."""
+        """Get the semantic version string for a given command.
+
+        The result is cached per executable, so repeated checks don't
+        re-run the tool.
+        """
+        key = (self.command, self.install_path)
+        if key not in self._version_cache:
+            self._version_cache[key] = self._probe_version()
+        return self._version_cache[key]
+
+    @classmethod
+    def _version_cache_clear(cls) -> None:
+        """Forget all previously detected tool versions."""
+        cls._version_cache.clear()
+
+    def _probe_version(self) -> str:
+        """Run the command to detect its semantic version string."""
         sp_child = self._execute_with_arguments(["--version"])
         version_str = str(sp_child.stdout, encoding="utf-8")
-        # After version like `8.0.0` is expected to be '\n' or ' '
-        # (\d.){1,2}(\d)
-        regex = r"((?:\d+\.)+[\d+_\+\-a-z]+)"
-        search = re.search(regex, version_str)
+        search = VERSION_REGEX.search(version_str)
         if not search or len(search.groups()) == 0:
             details = "The version format for this command has changed."
             self.raise_error("getting version", details)
@@ -127,8 +146,7 @@ class Command:
         return sp.run(  # nosec B603
             # We assemble the args internally so should be safe
             args,
-            stdout=sp.PIPE,
-            stderr=sp.PIPE,
+            capture_output=True,
             check=False,
             shell=False,
         )
@@ -1,16 +1,21 @@
 """Pytest configuration to create reusable fixtures."""
 
+from pathlib import Path
+
 import pytest
 
 from clipy_hooks.cli import Command, StaticAnalyzerCmd
 
+# Resolved once from this file so the suite doesn't depend on the cwd.
+CLI_DIR = Path(__file__).parent / "cli"
+
 CALL_ARGS = [
     "__main__.py",
     "--a-flag",
     "--an-arg=cli/__main__.py",
     "--install-dir",
-    "cli/",
-    "cli/__init__.py",
+    str(CLI_DIR),
+    str(CLI_DIR / "__init__.py"),
 ]
 
 
@@ -74,3 +74,14 @@ def test_run_static_analyser_non_zero(static_analyser: StaticAnalyzerCmd):
     static_analyser.args.insert(0, "--fail")
     with pytest.raises(SystemExit):
         assert not static_analyser.run_command()
+
+
+def test_command_version_cached(command: Command, monkeypatch: pytest.MonkeyPatch):
+    """Check the tool is only run once to detect its version."""
+    Command._version_cache_clear()
+    version = command.get_version_str()
+    monkeypatch.setattr(command, "_execute_with_arguments", None)
+    assert command.get_version_str() == version
+    Command._version_cache_clear()
+    with pytest.raises(TypeError):
+        command.get_version_str()